@@ -1,6 +1,6 @@
 """
 Prompts you for bus routes from the London Transit Commission (LTC) in London Ontario.
-Displays the distances and directions to all the buses on your selected routes.
+Displays the distances and directions to the nearest buses on your selected routes.
 
 The raw data is available from LTC under their terms of use:
 https://www.londontransit.ca/open-data/
@@ -8,17 +8,39 @@ https://www.londontransit.ca/open-data/
 
 import curses
 from curses import window
+import functools
 import json
+import logging
 import math
 import os
 import subprocess
+import sys
 import threading
 import time
 from typing import Any
-from typing import List
 from typing import Optional
+import numpy as np
 import requests
 
+try:
+    # Optional compiled geo kernels; see setup.py
+    import ltc_geo
+except ImportError:
+    ltc_geo = None
+
+try:
+    # Optional: much faster decode of the ~100 KB LTC payload when installed
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional JIT compilation of the distance/bearing kernel; unlike the Cython
+    # extension this needs no build step, just `pip install numba`
+    from numba import njit
+except ImportError:
+    njit = None
+
 
 # pylint: disable=C0103, C0301, R0903, W0603, W0702, W0718
 
@@ -26,12 +48,23 @@ import requests
 # LTC's open data URL for vehicle positions
 LTC_VEHICLE_URL = "http://gtfs.ltconline.ca/Vehicle/VehiclePositions.json"
 
+# Shared session so repeated polls reuse the TCP connection (keep-alive)
+# instead of paying DNS + connection setup every refresh
+SESSION = requests.Session()
+
 REFRESH_LTC_SECONDS = 10
 REFRESH_GPS_SECONDS = 10
 
+# Only the nearest buses are of interest; don't print more than this many
+MAX_BUSES_SHOWN = 10
+
 EARTH_RADIUS_KM = 6371
 
-thread_output: dict[str, Any] = {"location": None, "vehicles": None}
+# The version counters are bumped on every publish so consumers can
+# cheaply tell whether anything changed since they last looked.
+# Reads and writes go through OUTPUT_LOCK so a value and its version stay paired.
+thread_output: dict[str, Any] = {"location": None, "vehicles": None, "location_v": 0, "vehicles_v": 0}
+OUTPUT_LOCK = threading.Lock()
 
 DIRECTIONS = [
     "North",
@@ -44,11 +77,28 @@ DIRECTIONS = [
     "North West"
 ]
 
+# DIRECTIONS never changes at runtime, so its derived constants are computed once here
+_N_DIR = len(DIRECTIONS)
+
+# The mask trick in direction() requires len(DIRECTIONS) to be a power of two
+assert _N_DIR & (_N_DIR - 1) == 0
+
+_DIR_SCALE = _N_DIR / 360.0
+_DIR_MASK = _N_DIR - 1
+
+# NumPy view of DIRECTIONS for batched index lookups
+DIRECTIONS_ARR = np.array(DIRECTIONS, dtype=object)
+
 DEBUG = False
 
-routes : list[str] = []
+# Debug output goes through the logger; formatting only happens when debug is enabled
+logger = logging.getLogger(__name__)
+
+routes : tuple[str, ...] = ()
 
-stop = False
+# Set when the program is shutting down; threads wait on this instead of polling a flag,
+# so shutdown is immediate and idle waits are single interruptible syscalls
+STOP = threading.Event()
 
 out_row = 0
 
@@ -75,13 +125,13 @@ def prntln(text: str) -> None:
 
 def sleep(seconds: float):
     """
-    Calls time.sleep; signals to exit the program if interrupted
+    Waits up to the given number of seconds, returning early if the program is stopping;
+    signals to exit the program if interrupted
     """
-    global stop
     try:
-        time.sleep(seconds)
+        STOP.wait(seconds)
     except KeyboardInterrupt:
-        stop = True
+        STOP.set()
 
 
 def get_location() -> None:
@@ -89,28 +139,72 @@ def get_location() -> None:
     Retrieves the device's location in latitude and longitude.
     Stores the result in thread_output["location"] as a tuple[float, float]
 
+    termux-location is spawned once in '--request updates' mode and left running,
+    so each fix costs a pipe read instead of a full process fork + JNI setup.
+    The helper streams fixes faster than consumers need them, so the newest fix
+    is only published every REFRESH_GPS_SECONDS.
+
     This implementation assumes this script is running in termux on an Android device.
     Other devices will need to customize this method however appropriate.
     """
-    last_refresh = time.time() - REFRESH_GPS_SECONDS
-    while not stop:
-        start = time.time()
+    decoder = json.JSONDecoder()
+    buffer = ""
+    proc: Optional[subprocess.Popen] = None
+    pending: Optional[tuple[float, float]] = None
+    last_publish = time.monotonic() - REFRESH_GPS_SECONDS
+
+    while not STOP.is_set():
+        start = time.monotonic()
+
+        # (Re)start the helper if it isn't running
+        if proc is None or proc.poll() is not None:
+            proc = subprocess.Popen(["termux-location", "--request", "updates"], stdout=subprocess.PIPE)
+            os.set_blocking(proc.stdout.fileno(), False)
+            buffer = ""
+
+        # Drain whatever the helper has written since the last cycle
+        try:
+            chunk = os.read(proc.stdout.fileno(), 65536)
+        except BlockingIOError:
+            chunk = b""
+        if chunk:
+            buffer += chunk.decode("utf-8")
+
+        # termux-location emits one pretty-printed JSON object per fix; keep the newest complete one
+        tloc = None
+        while True:
+            stripped = buffer.lstrip()
+            if not stripped:
+                buffer = ""
+                break
+            try:
+                parsed, end = decoder.raw_decode(stripped)
+            except json.JSONDecodeError:
+                # Incomplete object; wait for more output
+                buffer = stripped
+                break
+            tloc = parsed
+            buffer = stripped[end:]
+
+        if tloc:
+            logger.debug("termux location: %s", tloc)
+            pending = (tloc["latitude"], tloc["longitude"])
+
+        # Publish the newest fix at most every REFRESH_GPS_SECONDS
+        if pending and start - last_publish >= REFRESH_GPS_SECONDS:
+            last_publish = start
 
-        if start - last_refresh >= REFRESH_GPS_SECONDS:
-            last_refresh = time.time()
-            tloc = json.loads(subprocess.run("termux-location", check=False, stdout=subprocess.PIPE, text=True).stdout)
-            if DEBUG:
-                prntln("termux location")
-                prntln(json.dumps(tloc, indent=4))
+            with OUTPUT_LOCK:
+                thread_output["location"] = pending
+                thread_output["location_v"] += 1
+            pending = None
 
-            thread_output["location"] = (tloc["latitude"], tloc["longitude"])
+        # Drain the helper's pipe about once a second
+        sleep(1 - (time.monotonic() - start))
 
-        # Loop every second so we can break out if interrupted
-        sleep_time = 1 - (time.time() - start)
-        if sleep_time > 0:
-            sleep(sleep_time)
-    if DEBUG:
-        prntln("get_location aborting.")
+    if proc and proc.poll() is None:
+        proc.terminate()
+    logger.debug("get_location aborting.")
 
 
 def get_vehicles() -> None:
@@ -118,198 +212,283 @@ def get_vehicles() -> None:
     Retrieves vehicle positions via LTC's open data URL
     Stores result in thread_output["vehicles"]
     """
-    last_refresh = time.time() - REFRESH_LTC_SECONDS
-    while not stop:
-        start = time.time()
+    while not STOP.is_set():
+        start = time.monotonic()
 
-        if start - last_refresh >= REFRESH_LTC_SECONDS:
-            last_refresh = time.time()
-            response = requests.get(LTC_VEHICLE_URL, timeout=30)
-            data = response.json()
+        response = SESSION.get(LTC_VEHICLE_URL, timeout=30)
+        data = orjson.loads(response.content) if orjson else response.json()
 
-            if DEBUG:
-                prntln("Vehicles:")
-                prntln(json.dumps(data, indent=4))
+        logger.debug("Vehicles: %s", data)
 
+        with OUTPUT_LOCK:
             thread_output["vehicles"] = [e["vehicle"] for e in data["entity"]]
+            thread_output["vehicles_v"] += 1
 
-        # Loop every second so we can break out if interrupted
-        sleep_time = 1 - (time.time() - start)
-        if sleep_time > 0:
-            sleep(sleep_time)
-    if DEBUG:
-        prntln("get_vehicles aborting.")
+        # Wait out the rest of the refresh interval; returns early if the program is stopping
+        sleep(REFRESH_LTC_SECONDS - (time.monotonic() - start))
+    logger.debug("get_vehicles aborting.")
 
 
-class Bus:
+def format_bus(route: Optional[str], lat: float, lng: float, distance: str, toward: str, facing: str) -> str:
     """
-    Data class; presents nice as an str
+    Formats a bus's stats; presents nice as an str.
+    'distance' is pre-rendered in km; 'toward' is the direction from you to the bus;
+    'facing' is the direction the bus is facing.
     """
-    def __init__(self, route: Optional[str], lat: float, lng: float, bearing: str):
-        self.route = route
-        self.lat = lat
-        self.lng = lng
-        # Direction the bus is facing
-        self.bearing = bearing
-        self.distance: float = -1
-        # Direction from you to the bus
-        self.direction: Optional[str] = None
-
-    def __str__(self):
-        if self.route:
-            return f"""Bus {self.route}, ({self.lat}, {self.lng}):
-    Distance: {self.distance:.3f} km {self.direction}
-    Direction: {self.bearing}"""
-        return f"""Bus ({self.lat}, {self.lng}):
-    Distance: {self.distance:.3f} km {self.direction}
-    Direction: {self.bearing}"""
+    header = f"Bus {route}, ({lat}, {lng}):" if route else f"Bus ({lat}, {lng}):"
+    return f"""{header}
+    Distance: {distance} km {toward}
+    Direction: {facing}"""
 
 
 def direction(degrees: float) -> str:
     """
     Takes a bearing in degrees; returns "North", "North East", etc.
     """
-    # E.g. if 4 directions, they each have 90 degrees; North = 315 to 45 degrees, East = 45 to 135, etc.
-    angle_per_direction = 360/len(DIRECTIONS)
+    if ltc_geo:
+        return DIRECTIONS[ltc_geo.direction_index(degrees, _N_DIR)]
 
-    # E.g. if 4 directions, add 45 degrees; North becomes 0 to 90 degrees; East becomes 90 to 180, etc.
-    shift = (degrees + angle_per_direction / 2) % 360
+    # Scale the bearing to direction buckets, round to the nearest bucket by adding 0.5,
+    # and wrap with a mask instead of a modulo (len(DIRECTIONS) is a power of two)
+    return DIRECTIONS[int(degrees * _DIR_SCALE + 0.5) & _DIR_MASK]
 
-    # Scale to the range of len(DIRECTIONS) to get an index
-    index = int(len(DIRECTIONS) * shift / 360)
-    return DIRECTIONS[index]
 
+def _prep_origin(loc: tuple[float, float]) -> tuple[float, float, float, float]:
+    """
+    Converts an origin point to radians and pre-computes its sin/cos.
+    The result is reusable across many haversine_from/azimuth_from calls,
+    so the origin's trig is only evaluated once per refresh rather than once per bus.
+    """
+    alat = math.radians(loc[0])
+    alng = math.radians(loc[1])
+    return alat, alng, math.sin(alat), math.cos(alat)
 
-def haversine(p1: tuple[float, float], p2: tuple[float, float]) -> float:
+
+def haversine_from(prep: tuple[float, float, float, float], blat: float, blng: float) -> float:
     """
-    Finds the great-circle distance between two points on a sphere; Earth in this case.
+    Finds the great-circle distance from a prepared origin (see _prep_origin)
+    to a point given in radians; Earth in this case.
 
     This implementation assumes the earth is round.
     If you live on a flat earth, you will need to customize this method to apply the pythagorean theorem.
     """
-    alat = math.radians(p1[0])
-    alng = math.radians(p1[1])
-    blat = math.radians(p2[0])
-    blng = math.radians(p2[1])
+    alat, alng, _, cos_alat = prep
 
-    distance = EARTH_RADIUS_KM * math.acos(
-        (math.sin(alat) * math.sin(blat)) +
-        (math.cos(alat) * math.cos(blat) * math.cos(
-            alng - blng
-        ))
-    )
-    return distance
+    # Half-angle (haversine) form; numerically stable for nearby points,
+    # unlike the spherical law of cosines whose acos argument saturates near 1.
+    dlat = blat - alat
+    dlng = blng - alng
+    a = math.sin(dlat * 0.5) ** 2 + cos_alat * math.cos(blat) * math.sin(dlng * 0.5) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
 
 
-def azimuth(p1: tuple[float, float], p2: tuple[float, float]) -> float:
+def azimuth_from(prep: tuple[float, float, float, float], blat: float, blng: float) -> float:
     """
-    Calculates the bearing in degrees when facing p2 from p1's location
+    Calculates the bearing in degrees when facing a point given in radians
+    from a prepared origin (see _prep_origin)
     """
-    alat = math.radians(p1[0])
-    alng = math.radians(p1[1])
-    blat = math.radians(p2[0])
-    blng = math.radians(p2[1])
+    _, alng, sin_alat, cos_alat = prep
 
     dlng = blng - alng
     y = math.sin(dlng) * math.cos(blat)
-    x = math.cos(alat) * math.sin(blat) - math.sin(alat) * math.cos(blat) * math.cos(dlng)
+    x = cos_alat * math.sin(blat) - sin_alat * math.cos(blat) * math.cos(dlng)
     bearing = math.atan2(y, x)
     return math.degrees(bearing + 2*math.pi) % 360
 
 
+def haversine(p1: tuple[float, float], p2: tuple[float, float]) -> float:
+    """
+    Finds the great-circle distance between two points on a sphere; Earth in this case.
+    """
+    if ltc_geo:
+        return ltc_geo.haversine(p1[0], p1[1], p2[0], p2[1])
+    return haversine_from(_prep_origin(p1), math.radians(p2[0]), math.radians(p2[1]))
+
+
+def azimuth(p1: tuple[float, float], p2: tuple[float, float]) -> float:
+    """
+    Calculates the bearing in degrees when facing p2 from p1's location
+    """
+    if ltc_geo:
+        return ltc_geo.azimuth(p1[0], p1[1], p2[0], p2[1])
+    return azimuth_from(_prep_origin(p1), math.radians(p2[0]), math.radians(p2[1]))
+
+
+if njit:
+    @njit(cache=True, fastmath=True)
+    def _compute_all_jit(lats, lngs, alat, alng, sin_alat, cos_alat):
+        """
+        Numba build of _compute_all's kernel: one explicit loop that LLVM
+        compiles (and autovectorizes) with the libm calls inlined
+        """
+        n = lats.size
+        distances = np.empty(n, dtype=np.float64)
+        bearings = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            blat = math.radians(lats[i])
+            blng = math.radians(lngs[i])
+            sin_blat = math.sin(blat)
+            cos_blat = math.cos(blat)
+            dlng = blng - alng
+            cos_dlng = math.cos(dlng)
+
+            a = math.sin((blat - alat) * 0.5) ** 2 + cos_alat * cos_blat * math.sin(dlng * 0.5) ** 2
+            distances[i] = 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+            y = math.sin(dlng) * cos_blat
+            x = cos_alat * sin_blat - sin_alat * cos_blat * cos_dlng
+            bearings[i] = (math.degrees(math.atan2(y, x)) + 360) % 360
+        return distances, bearings
+
+
+def _compute_all(lats: np.ndarray, lngs: np.ndarray, prep: tuple[float, float, float, float]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Fused haversine + azimuth kernel: takes bus lat/lng columns in degrees and a
+    prepared origin (see _prep_origin); returns (distances in km, bearings in degrees).
+    Runs the Numba-compiled loop when numba is installed; otherwise the trig is
+    batched with NumPy, one set of ufunc calls instead of per-bus math.* calls.
+    """
+    alat, alng, sin_alat, cos_alat = prep
+
+    if njit:
+        return _compute_all_jit(lats, lngs, alat, alng, sin_alat, cos_alat)
+
+    blat = np.radians(lats)
+    blng = np.radians(lngs)
+    sin_blat = np.sin(blat)
+    cos_blat = np.cos(blat)
+    dlat = blat - alat
+    dlng = blng - alng
+    cos_dlng = np.cos(dlng)
+
+    # Half-angle (haversine) form; numerically stable for nearby points
+    a = np.sin(dlat * 0.5) ** 2 + cos_alat * cos_blat * np.sin(dlng * 0.5) ** 2
+    distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+    y = np.sin(dlng) * cos_blat
+    x = cos_alat * sin_blat - sin_alat * cos_blat * cos_dlng
+    bearings = (np.degrees(np.arctan2(y, x)) + 360) % 360
+
+    return distances, bearings
+
+
 def print_buses() -> None:
     """
-    Prints all the buses for the user's selected routes sorted by distance.
+    Prints the nearest buses (up to MAX_BUSES_SHOWN) on the user's selected routes sorted by distance.
     If we don't yet have enough information, prints which service we're waiting on.
     """
+    # Snapshot both outputs atomically so a fresh vehicle list can't get paired with
+    # a stale location; publishers replace values wholesale, so no defensive copy is needed
+    with OUTPUT_LOCK:
+        all_vehicles = thread_output["vehicles"]
+        loc = thread_output["location"]
+
     # Inform user if we haven't gotten a response from LTC yet:
-    if not thread_output["vehicles"]:
+    if not all_vehicles:
         # LTC is behind schedule!
         prntln("Still waiting on LTC...")
         return
 
-    # Halt until the vehicle thread completes; grab the output
-    vehicles = list(thread_output["vehicles"])
+    # Filter vehicles on the desired routes in one pass over the snapshot;
+    # frozenset membership is O(1) where scanning the routes list was O(R) per vehicle
+    routes_set = frozenset(routes)
+    vehicles = [vehicle for vehicle in all_vehicles if vehicle["trip"]["route_id"] in routes_set]
 
-    # Filter vehicles on the desired route
-    vehicles = [vehicle for vehicle in vehicles if vehicle["trip"]["route_id"] in routes]
+    logger.debug("Buses on selected routes: %s", vehicles)
 
-    if DEBUG:
-        prntln("Buses on selected routes:")
-        prntln(json.dumps(vehicles, indent=4))
+    # Structure-of-arrays: one column per bus attribute, so the trig below runs on
+    # contiguous float64 columns with no per-object attribute lookups
+    n = len(vehicles)
+    route_ids = np.empty(n, dtype=object)
+    lats = np.empty(n, dtype=np.float64)
+    lngs = np.empty(n, dtype=np.float64)
+    bus_bearings = np.empty(n, dtype=np.float64)
 
-    buses = [
-        Bus(
-            v["trip"]["route_id"] if len(routes) > 1 else None,
-            float(v["position"]["latitude"]),
-            float(v["position"]["longitude"]),
-            direction(v["position"]["bearing"])
-        )
-        for v in vehicles
-    ]
+    for i, v in enumerate(vehicles):
+        route_ids[i] = v["trip"]["route_id"] if len(routes) > 1 else None
+        lats[i] = float(v["position"]["latitude"])
+        lngs[i] = float(v["position"]["longitude"])
+        bus_bearings[i] = v["position"]["bearing"]
 
     # Inform user if we're not done pew pewing satellites
-    if not thread_output["location"]:
+    if not loc:
         prntln("Termux-location still pew pewing satellites...")
         return
 
-    # Halt until satellite pew pew triangulation is finished; grab the cooordinates
-    loc = thread_output["location"]
-    if DEBUG:
-        prntln("Location")
-        prntln(loc)
+    logger.debug("Location: %s", loc)
+
+    # Calculate bus distances, and which direction they're in relative to our position.
+    # The origin's radians and trig are invariant across buses; compute them once
+    distances, bearings = _compute_all(lats, lngs, _prep_origin(loc))
 
-    # Calculate bus distances, and which direction they're in relative to our position
-    for bus in buses:
-        bloc = (bus.lat, bus.lng)
-        bus.distance = haversine(loc, bloc)
-        bus.direction = direction(azimuth(loc, bloc))
+    # Branchless batched version of direction(), for both the direction toward
+    # each bus and the direction each bus is facing
+    toward = DIRECTIONS_ARR[(bearings * _DIR_SCALE + 0.5).astype(np.int64) & _DIR_MASK]
+    facing = DIRECTIONS_ARR[(bus_bearings * _DIR_SCALE + 0.5).astype(np.int64) & _DIR_MASK]
 
-    # Sort buses by distance; nearest at the bottom, then print them
-    buses.sort(key=lambda b: b.distance, reverse = True)
-    prntln("\n".join(str(bus) for bus in buses))
+    # Keep only the MAX_BUSES_SHOWN nearest buses, sorted with the nearest at the bottom.
+    # argpartition selects the nearest in O(n); only the survivors get fully sorted
+    if n > MAX_BUSES_SHOWN:
+        nearest = np.argpartition(distances, MAX_BUSES_SHOWN)[:MAX_BUSES_SHOWN]
+        order = nearest[np.argsort(distances[nearest])][::-1]
+    else:
+        order = np.argsort(distances)[::-1]
+
+    # Pre-format the distance column, then build the whole block with one join
+    dists_str = [f"{d:.3f}" for d in distances[order]]
+    prntln("\n".join(
+        format_bus(route_ids[i], lats[i], lngs[i], d_str, toward[i], facing[i])
+        for d_str, i in zip(dists_str, order)
+    ))
 
 
 def refresh_loop(stdscr: Optional[window]) -> None:
     """
-    Prints bus locations regularly at a refresh rate.
-    The refresh rate is calculated using the greatest common denominator of the configured GPS and LTC refresh rates.
+    Prints bus locations whenever new data arrives from the GPS or LTC threads.
     If the user's selected bus routes change, the bus locations are refreshed immediately.
     """
-    global stop
     global scr
     global out_row
 
     scr = stdscr
 
-    refresh_rate = math.gcd(REFRESH_GPS_SECONDS, REFRESH_LTC_SECONDS)
-    last_refresh = time.time() - refresh_rate
+    # The last (location version, vehicles version, routes) that was rendered
+    last_render: tuple = (-1, -1, None)
 
-    last_routes = routes
+    # Even when the data versions churn, don't redraw more often than this;
+    # a route change from the user still redraws immediately
+    min_redraw = math.gcd(REFRESH_GPS_SECONDS, REFRESH_LTC_SECONDS)
+    last_draw = time.monotonic() - min_redraw
 
-    while not stop:
+    while not STOP.is_set():
         out_row = 0
 
-        start = time.time()
+        with OUTPUT_LOCK:
+            render_state = (thread_output["location_v"], thread_output["vehicles_v"], routes)
 
-        if start - last_refresh < refresh_rate and last_routes == routes:
-            # Continue for 'stop' interrupt every second
+        now = time.monotonic()
+        routes_changed = render_state[2] != last_render[2]
+        if render_state == last_render or (not routes_changed and now - last_draw < min_redraw):
+            # Nothing new to show, or it's too soon to redraw; check again in a second
             sleep(1)
             continue
 
-        last_refresh = time.time()
-        last_routes = routes
+        last_render = render_state
+        last_draw = now
 
         try:
             if use_curses and scr:
                 scr.clear()
-            else:
-                os.system('clear')
+            elif sys.stdout.isatty():
+                # Home the cursor and clear the screen with one write; forking
+                # `clear` costs a whole process just to emit this escape sequence
+                sys.stdout.write("\x1b[H\x1b[2J")
+                sys.stdout.flush()
 
             prntln(time.ctime())
 
             route_word = "route" if len(routes) == 1 else "routes"
-            prntln(f"Showing buses on {route_word} {', '.join(routes)}.")
+            prntln(f"Showing the nearest buses (up to {MAX_BUSES_SHOWN}) on {route_word} {', '.join(routes)}.")
             prntln("Refreshes data from LTC every 10 seconds;")
             prntln("data typically updates every 30 seconds.")
             prntln("You may enter different bus routes,")
@@ -320,20 +499,21 @@ def refresh_loop(stdscr: Optional[window]) -> None:
             if use_curses and scr:
                 scr.refresh()
         except:
-            stop = True
-    if DEBUG:
-        prntln("refresh_loop aborting.")
+            STOP.set()
+    logger.debug("refresh_loop aborting.")
 
 
-def to_route_list(user_input: str) -> List[str]:
+@functools.lru_cache(maxsize=64)
+def to_route_list(user_input: str) -> tuple[str, ...]:
     """
-    Parses user input into a list of bus routes, padded to match the LTC json data (E.g. route 2 is "02").
-    Routes can be delimited with commas or whitespace
+    Parses user input into a tuple of bus routes, padded to match the LTC json data (E.g. route 2 is "02").
+    Routes can be delimited with commas or whitespace.
+    Cached, so re-entering the same input returns the identical tuple without re-parsing.
     """
     route_list = user_input.replace(",", " ").split()
 
     # LTC pads single digit routes to two digits, E.g. 2 -> 02
-    return [route.zfill(2) for route in route_list]
+    return tuple(route.zfill(2) for route in route_list)
 
 
 def read_routes_loop() -> None:
@@ -342,12 +522,11 @@ def read_routes_loop() -> None:
     Allows the user to change which routes are being filtered on or to quit the program.
     """
     global routes
-    global stop
 
     exit_words = ["quit", "exit"]
 
     in_str = None
-    while not stop and in_str not in exit_words:
+    while not STOP.is_set() and in_str not in exit_words:
         if use_curses and scr:
             try:
                 in_str = scr.getstr(out_row, 0).decode(encoding="utf-8")
@@ -370,9 +549,8 @@ def read_routes_loop() -> None:
             elif in_str not in exit_words:
                 prntln(f"Invalid input: {in_str}")
 
-    stop = True
-    if DEBUG:
-        prntln("read_routes_loop aborting.")
+    STOP.set()
+    logger.debug("read_routes_loop aborting.")
 
 
 def main() -> None:
@@ -381,6 +559,8 @@ def main() -> None:
     """
     global routes
 
+    logging.basicConfig(level=logging.DEBUG if DEBUG else logging.WARNING)
+
     # While we wait for user input, pew some satellites and stuff
     loc_thread = threading.Thread(target=get_location)
     loc_thread.start()
@@ -0,0 +1,49 @@
+# cython: language_level=3
+"""
+Optional compiled geo kernels for ltc.py.
+
+Build with: python setup.py build_ext --inplace
+ltc.py falls back to its pure-Python implementations when this module isn't built.
+"""
+
+from libc.math cimport sin, cos, asin, atan2, sqrt, fmod, M_PI
+
+
+cdef double EARTH_RADIUS_KM = 6371
+cdef double DEG_TO_RAD = M_PI / 180
+cdef double RAD_TO_DEG = 180 / M_PI
+
+
+cpdef double haversine(double alat_deg, double alng_deg, double blat_deg, double blng_deg) nogil:
+    """
+    Finds the great-circle distance in km between two points given in degrees
+    """
+    cdef double alat = alat_deg * DEG_TO_RAD
+    cdef double blat = blat_deg * DEG_TO_RAD
+    cdef double dlat = blat - alat
+    cdef double dlng = (blng_deg - alng_deg) * DEG_TO_RAD
+    cdef double sin_dlat = sin(dlat * 0.5)
+    cdef double sin_dlng = sin(dlng * 0.5)
+    cdef double a = sin_dlat * sin_dlat + cos(alat) * cos(blat) * sin_dlng * sin_dlng
+    return 2 * EARTH_RADIUS_KM * asin(sqrt(a))
+
+
+cpdef double azimuth(double alat_deg, double alng_deg, double blat_deg, double blng_deg) nogil:
+    """
+    Calculates the bearing in degrees when facing point b from point a's location
+    """
+    cdef double alat = alat_deg * DEG_TO_RAD
+    cdef double blat = blat_deg * DEG_TO_RAD
+    cdef double dlng = (blng_deg - alng_deg) * DEG_TO_RAD
+    cdef double y = sin(dlng) * cos(blat)
+    cdef double x = cos(alat) * sin(blat) - sin(alat) * cos(blat) * cos(dlng)
+    return fmod(atan2(y, x) * RAD_TO_DEG + 360, 360)
+
+
+cpdef int direction_index(double degrees, int n_directions) nogil:
+    """
+    Takes a bearing in degrees; returns an index into a list of n_directions compass names
+    """
+    cdef double angle_per_direction = 360.0 / n_directions
+    cdef double shift = fmod(degrees + angle_per_direction * 0.5, 360)
+    return <int>(n_directions * shift / 360)
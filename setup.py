@@ -0,0 +1,19 @@
+"""
+Builds the optional ltc_geo Cython extension:
+    pip install cython
+    python setup.py build_ext --inplace
+ltc.py runs fine without it; it just uses the pure-Python geo functions instead.
+"""
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+setup(
+    ext_modules=cythonize([
+        Extension(
+            "ltc_geo",
+            ["ltc_geo.pyx"],
+            extra_compile_args=["-O3", "-ffast-math"],
+        )
+    ])
+)